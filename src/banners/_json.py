@@ -0,0 +1,69 @@
+"""JSON helpers shared by the banner backends.
+
+orjson is used when installed for faster serialization, with the
+stdlib json module as the fallback.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError: # Fall back to the stdlib without orjson
+    orjson = None
+
+## orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj) -> str:
+    """Serialize an object to a JSON string.
+
+    Parameters
+    ----------
+    obj: Any
+        Object to serialize.
+
+    Returns
+    -------
+    The JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize an object to JSON bytes.
+
+    Skips the extra UTF-8 encode for writers that accept bytes, since
+    orjson emits bytes natively.
+
+    Parameters
+    ----------
+    obj: Any
+        Object to serialize.
+
+    Returns
+    -------
+    The JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data):
+    """Deserialize a JSON document.
+
+    Parameters
+    ----------
+    data: str or bytes
+        JSON document to deserialize.
+
+    Returns
+    -------
+    The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
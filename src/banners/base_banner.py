@@ -2,6 +2,8 @@
 
 import abc
 import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable
 
@@ -16,11 +18,42 @@ class BaseBanner(abc.ABC):
             The maximum number of events before they are deleted automatically
         **watch_rate: int (default=5)
             The cycle rate to repeat looking for new events
+        **max_watchers: int (default=8)
+            The maximum number of concurrently watched topics. Each
+            watcher occupies one pool thread for its lifetime, so
+            watch raises once this many topics are being watched.
+        **batch_size: int (default=1)
+            Number of events to coalesce per commit. 1 disables batching
+            and every wave is written immediately.
+        **flush_interval: float (default=0.5)
+            Maximum seconds a buffered event waits before being flushed
         """
         # Consider implementing with a singleton, at least for wathed_topics
         self.watched_topics = {}
         self.max_events_in_topic = kwargs.get('max_events_in_topic', 50)
         self.watch_rate = kwargs.get('watch_rate', 5)
+        self._wave_counter = defaultdict(int)
+        self.max_watchers = kwargs.get('max_watchers', 8)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_watchers,
+            thread_name_prefix="banners_watch",
+        )
+
+        ## Optional wave coalescing buffer
+        self.batch_size = kwargs.get('batch_size', 1)
+        self.flush_interval = kwargs.get('flush_interval', 0.5)
+        self._pending = deque()
+        self._flush_lock = threading.Lock()
+        self._flush_condition = threading.Condition()
+        self._flush_exit = False
+        self._flusher = None
+        if self.batch_size > 1:
+            self._flusher = threading.Thread(
+                target=self._flush_thread,
+                name="banners_flush",
+                daemon=True,
+            )
+            self._flusher.start()
 
         ## Alias Functions
         self.publish = self.wave
@@ -28,16 +61,26 @@ class BaseBanner(abc.ABC):
         self.cleanup = self.retire
 
     def __del__(self):
-        """Destructor that kills all active threads."""
+        """Destructor that kills all active watchers."""
         self.watch_rate = 0
         topics = list(self.watched_topics.keys())
         for topic in topics:
             self.ignore(topic)
+        if self._flusher is not None:
+            with self._flush_condition:
+                self._flush_exit = True
+                self._flush_condition.notify()
+            self._flusher.join()
+            self._flusher = None
+        self._pool.shutdown(wait=False)
 
-    @abc.abstractmethod
     def wave(self, topic: str, body: dict = None):
         """Create a new event in a given topic.
 
+        With batching enabled (batch_size > 1) the event is buffered and
+        committed by a background flusher; otherwise it is written
+        immediately. Use wave_sync when durability is required.
+
         Parameters
         ----------
         topic: str
@@ -45,6 +88,83 @@ class BaseBanner(abc.ABC):
         body: dict
             Information to publish to the topic.
         """
+        body = self._validate_body(body, topic)
+        if self._flusher is None:
+            self._wave_batch([(topic, body)])
+            return
+        with self._flush_condition:
+            self._pending.append((topic, body))
+            if len(self._pending) >= self.batch_size:
+                self._flush_condition.notify()
+
+    def wave_sync(self, topic: str, body: dict = None):
+        """Create a new event, bypassing the coalescing buffer.
+
+        Flushes any buffered events first so publish order is kept.
+
+        Parameters
+        ----------
+        topic: str
+            Topic under which to publish the new event.
+        body: dict
+            Information to publish to the topic.
+        """
+        self.flush()
+        body = self._validate_body(body, topic)
+        self._wave_batch([(topic, body)])
+
+    def wave_many(self, topic: str, bodies: list):
+        """Create many events in a given topic with one backend call.
+
+        The whole batch is committed as a single backend write, so bulk
+        publishing pays one round-trip instead of one per event.
+        Flushes any buffered events first so publish order is kept.
+
+        Parameters
+        ----------
+        topic: str
+            Topic under which to publish the new events.
+        bodies: list
+            Information dictionaries to publish, in order.
+        """
+        self.flush()
+        events = [
+            (topic, self._validate_body(body, topic))
+            for body in bodies
+        ]
+        if events:
+            self._wave_batch(events)
+
+    def flush(self):
+        """Commit any buffered events immediately."""
+        with self._flush_lock:
+            with self._flush_condition:
+                pending = list(self._pending)
+                self._pending.clear()
+            if pending:
+                self._wave_batch(pending)
+
+    def _flush_thread(self):
+        """Drain the coalescing buffer on batch_size or flush_interval."""
+        while True:
+            with self._flush_condition:
+                if not self._pending and not self._flush_exit:
+                    self._flush_condition.wait(self.flush_interval)
+                exiting = self._flush_exit
+            self.flush()
+            if exiting:
+                return
+
+    @abc.abstractmethod
+    def _wave_batch(self, events: list):
+        """Abstracted implementation of logic to commit a batch of events.
+
+        Parameters
+        ----------
+        events: list
+            (topic, body) pairs to write, in publish order. Bodies have
+            already been validated.
+        """
         raise NotImplementedError
 
     def _validate_body(self, body: dict, topic: str):
@@ -72,7 +192,10 @@ class BaseBanner(abc.ABC):
               start_time: str="") -> None:
         """Subscribe to a new topic.
 
-        Spawn a new thread that watches for a new topic.
+        Submit a polling task to the shared watcher pool. The pool
+        holds max_watchers workers and each watcher occupies one for
+        its lifetime, so watching more topics than that raises rather
+        than silently queueing a watcher that would never run.
 
         Parameters
         ----------
@@ -85,15 +208,17 @@ class BaseBanner(abc.ABC):
         """
         if topic in self.watched_topics:
             raise ValueError(f"Topic: {topic} already being watched")
+        if len(self.watched_topics) >= self.max_watchers:
+            raise ValueError(
+                f"Watcher pool is full ({self.max_watchers} topics); "
+                "increase max_watchers to watch more topics"
+            )
         self.watched_topics[topic] = {
-            "thread": threading.Thread(
-                        target=self._watch_thread,
-                        name=f"banners_watch_{topic}",
-                        args=(topic, callback, start_time),
-                      ),
             "event": threading.Event()
         }
-        self.watched_topics[topic]['thread'].start()
+        self.watched_topics[topic]['future'] = self._pool.submit(
+            self._watch_thread, topic, callback, start_time
+        )
 
     @abc.abstractmethod
     def _watch_thread(self, topic: str,
@@ -122,9 +247,27 @@ class BaseBanner(abc.ABC):
         """
         if topic not in self.watched_topics:
             return
-        thread = self.watched_topics.pop(topic)
-        thread['event'].set()
-        thread['thread'].join()
+        watcher = self.watched_topics.pop(topic)
+        watcher['event'].set()
+        if not watcher['future'].cancel():
+            watcher['future'].result()
+
+    def _maybe_retire(self, topic: str):
+        """Run retire on a sampled subset of waves.
+
+        Calling retire on every publish re-scans the topic each time.
+        Sampling one call in max_events_in_topic // 10 keeps the topic
+        near its bound while amortizing the cleanup cost.
+
+        Parameters
+        ----------
+        topic: str
+            Topic that was just published to.
+        """
+        self._wave_counter[topic] += 1
+        retire_interval = max(1, self.max_events_in_topic // 10)
+        if self._wave_counter[topic] % retire_interval == 0:
+            self.retire(topic)
 
     @abc.abstractmethod
     def retire(self, topic: str, num_keep: int =10):
@@ -142,13 +285,20 @@ class BaseBanner(abc.ABC):
     def _generate_timestamp_string(self) -> str:
         """Create a timestamp of the current time.
 
-        Timestamp is formatted is %Y%m%d-%H%M%S%f
+        Timestamp is formatted is %Y%m%d-%H%M%S%f. Formatted from the
+        datetime's integer fields directly; wave calls this per event,
+        and f-string formatting skips the C strftime/locale path.
 
         Returns
         -------
         A string of the current timestamp
         """
-        return datetime.now().strftime("%Y%m%d-%H%M%S%f")
+        now = datetime.now()
+        return (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}-"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+            f"{now.microsecond:06d}"
+        )
 
     @abc.abstractmethod
     def recall_events(self, topic: str, num_retrieve: int=None):
@@ -166,6 +316,25 @@ class BaseBanner(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def recall_events_iter(self, topic: str, num_retrieve: int=None):
+        """Yield the most recent N events in the topic, one at a time.
+
+        Streaming variant of recall_events for callers that iterate
+        once; wrap in list() when a full list is needed.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to recall events.
+        num_retrieve: int (default=None)
+            Number of events to retrieve. None yields max_events_in_topic
+        Returns
+        -------
+        A generator of events
+        """
+        raise NotImplementedError
+
     def _verify_recall_num_retrieve(self, num_retrieve: int=None):
         if num_retrieve is None:
             num_retrieve = self.max_events_in_topic
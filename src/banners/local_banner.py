@@ -1,14 +1,48 @@
 """Implementation of LocalBanner"""
 
-import json
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError: # Fall back to pure polling without watchdog
+    Observer = None
+    FileSystemEventHandler = object
+
+from . import _json
 from .base_banner import BaseBanner
 
 
+class _TopicWakeDispatcher(FileSystemEventHandler):
+    """Wake the watcher of whichever topic a file event lands in."""
+    def __init__(self, banner):
+        self._banner = banner
+
+    def _wake(self, path):
+        """Signal the watcher of the topic containing the given path."""
+        topic = os.path.basename(os.path.dirname(path))
+        watcher = self._banner.watched_topics.get(topic)
+        if watcher is not None and 'wake' in watcher:
+            watcher['wake'].set()
+
+    def on_created(self, event):
+        """Signal the watcher when a file lands in its topic folder."""
+        self._wake(event.src_path)
+
+    def on_modified(self, event):
+        """Signal the watcher when a topic file finishes being written."""
+        self._wake(event.src_path)
+
+    def on_moved(self, event):
+        """Signal the watcher when a file is renamed into a topic folder."""
+        self._wake(event.dest_path)
+
+
 class LocalBanner(BaseBanner):
     """Banner implementation that uses a local filesystem"""
     def __init__(self, **kwargs):
@@ -28,31 +62,73 @@ class LocalBanner(BaseBanner):
             )
         )
         Path(self.root_path).mkdir(exist_ok=True)
+        ## One filesystem observer is shared by every topic watcher
+        self._observer = None
+        self._observer_lock = threading.Lock()
+
+    def __del__(self):
+        """Destructor that also stops the shared filesystem observer."""
+        super().__del__()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
 
-    def wave(self, topic: str, body: dict = None) -> None:
-        """Create a new event in a given topic.
+    def _get_observer(self):
+        """Return the shared filesystem observer, starting it lazily.
+
+        A single observer watches root_path for the whole banner and
+        dispatches wake-ups per topic, so threads and inotify watches
+        do not grow with the number of watched topics.
+
+        Returns
+        -------
+        The running observer, or None without watchdog installed
+        """
+        if Observer is None:
+            return None
+        with self._observer_lock:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.schedule(
+                    _TopicWakeDispatcher(self),
+                    self.root_path,
+                    recursive=True,
+                )
+                self._observer.start()
+        return self._observer
+
+    def _wave_batch(self, events: list) -> None:
+        """Write a batch of events to their topic folders.
+
+        Each event is written to a .tmp file and renamed into place, so
+        watchers never observe a half-written event.
 
         Parameters
         ----------
-        topic: str
-            Topic under which to publish the new event.
-        body: dict
-            Information to publish to the topic.
+        events: list
+            (topic, body) pairs to write, in publish order.
         """
-        body = self._validate_body(body, topic)
-
-        topic_path = Path(self.root_path)  / topic
-        topic_path.mkdir(exist_ok=True)
-        file_name = self._generate_timestamp_string()
-        file_path = topic_path / (file_name + ".json")
-        file_path.write_text(json.dumps(body))
+        for topic, body in events:
+            topic_path = Path(self.root_path)  / topic
+            topic_path.mkdir(exist_ok=True)
+            file_name = self._generate_timestamp_string()
+            file_path = topic_path / (file_name + ".json")
+            tmp_path = topic_path / (file_name + ".json.tmp")
+            tmp_path.write_bytes(_json.dumps_bytes(body))
+            os.replace(tmp_path, file_path)
 
-        self.retire(topic)
+        for topic, _ in events:
+            self._maybe_retire(topic)
 
     def _watch_thread(self, topic: str,
               callback: Callable[dict, None],
               start_time: str="") -> None:
-        """Look for events by ls'ing the topic directory
+        """Look for events in the topic directory.
+
+        When watchdog is installed the kernel filesystem watcher wakes
+        the loop as soon as a file is created; otherwise the loop wakes
+        every watch_rate seconds and rescans.
 
         Parameters
         ----------
@@ -65,24 +141,110 @@ class LocalBanner(BaseBanner):
         """
         topic_folder = os.path.join(self.root_path, topic)
         exit_event = self.watched_topics[topic]['event']
+        wake_event = threading.Event()
+        self.watched_topics[topic]['wake'] = wake_event
+        observer = self._get_observer()
 
         ## Loop until the thread is removed, or the event is thrown
+        ## Scan first so events published before the observer was
+        ## registered are not missed.
         while topic in self.watched_topics and not exit_event.is_set():
-            exit_event.wait(self.watch_rate)
-            if not os.path.exists(topic_folder):
-                continue
-            topic_files = sorted(os.listdir(topic_folder))
-            new_files = [f for f in topic_files if f > start_time]
+            new_files = self._new_topic_files(topic_folder, start_time)
             for file in new_files:
-                # Ignore old files
-                if Path(file).stem <= start_time:
-                    continue
-                start_time = Path(file).stem # Update start time
-
                 # Load json into callback
-                file_path = os.path.join(topic_folder, file)
-                with open(file_path, encoding="utf-8") as f:
-                    callback(json.load(f))
+                try:
+                    data = self._load_event_file(
+                        os.path.join(topic_folder, file)
+                    )
+                except _json.JSONDecodeError:
+                    # Still being written; retry on the next wake
+                    break
+                start_time = self._file_stem(file) # Update start time
+                callback(data)
+            if observer is None:
+                exit_event.wait(self.watch_rate)
+            else:
+                wake_event.wait(self.watch_rate)
+                wake_event.clear()
+
+    @staticmethod
+    def _file_stem(file_name: str) -> str:
+        """Strip the .json suffix without constructing a Path.
+
+        Parameters
+        ----------
+        file_name: str
+            Name of an event file.
+
+        Returns
+        -------
+        The timestamp stem of the file name
+        """
+        if file_name.endswith(".json"):
+            return file_name[:-5]
+        return file_name
+
+    @staticmethod
+    def _load_event_file(file_path: str) -> dict:
+        """Read and deserialize a single event file.
+
+        Parameters
+        ----------
+        file_path: str
+            Path of the event file to load.
+
+        Returns
+        -------
+        The event dictionary
+        """
+        return _json.loads(Path(file_path).read_bytes())
+
+    def _new_topic_files(self, topic_folder: str, start_time: str) -> list:
+        """List topic files newer than start_time, oldest first.
+
+        Scans with os.scandir and only sorts the new entries, so an
+        idle poll does no sorting at all.
+
+        Parameters
+        ----------
+        topic_folder: str
+            Folder of the topic being watched.
+        start_time: str
+            Timestamp stem of the last processed file.
+
+        Returns
+        -------
+        A chronologically sorted list of unprocessed file names
+        """
+        try:
+            with os.scandir(topic_folder) as entries:
+                new_files = [
+                    entry.name for entry in entries
+                    if not entry.name.endswith(".tmp")
+                    and self._file_stem(entry.name) > start_time
+                ]
+        except FileNotFoundError:
+            return []
+        new_files.sort()
+        return new_files
+
+    def ignore(self, topic: str):
+        """Unsubscribe from a topic.
+
+        Wakes the watcher immediately so it exits without waiting out
+        a full watch_rate cycle.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to ignore.
+        """
+        watcher = self.watched_topics.get(topic)
+        if watcher is not None:
+            watcher['event'].set()
+            if 'wake' in watcher:
+                watcher['wake'].set()
+        super().ignore(topic)
 
     def retire(self, topic: str, num_keep: int=None) -> None:
         """Delete old events in a given topic.
@@ -101,7 +263,11 @@ class LocalBanner(BaseBanner):
         topic_folder = os.path.join(self.root_path, topic)
         if not os.path.exists(topic_folder):
             return
-        topic_files = os.listdir(topic_folder)
+        with os.scandir(topic_folder) as entries:
+            topic_files = [
+                entry.name for entry in entries
+                if not entry.name.endswith(".tmp")
+            ]
         files_to_delete = topic_files[:-num_keep or None]
         for file in files_to_delete:
             (Path(topic_folder) / file).unlink()
@@ -121,13 +287,58 @@ class LocalBanner(BaseBanner):
         """
         num_retrieve = self._verify_recall_num_retrieve(num_retrieve)
 
+        file_paths = self._recall_file_paths(topic, num_retrieve)
+        if not file_paths:
+            return []
+        ## Read the files in parallel; the kernel can service many
+        ## small reads at once
+        with ThreadPoolExecutor(
+            max_workers=min(len(file_paths), 16)
+        ) as executor:
+            return list(executor.map(self._load_event_file, file_paths))
+
+    def recall_events_iter(self, topic: str, num_retrieve: int=None):
+        """Yield the most recent N events in the topic, one at a time.
+
+        Streaming variant of recall_events; only one event is held in
+        memory at a time.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to recall events.
+        num_retrieve: int (default=None)
+            Number of events to retrieve. None yields max_events_in_topic
+        Returns
+        -------
+        A generator of events
+        """
+        num_retrieve = self._verify_recall_num_retrieve(num_retrieve)
+
+        for file_path in self._recall_file_paths(topic, num_retrieve):
+            yield self._load_event_file(file_path)
+
+    def _recall_file_paths(self, topic: str, num_retrieve: int) -> list:
+        """List the paths of the most recent N event files.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to recall events.
+        num_retrieve: int
+            Number of event files to list.
+
+        Returns
+        -------
+        A chronologically sorted list of file paths
+        """
         topic_folder = os.path.join(self.root_path, topic)
         if not os.path.exists(topic_folder):
             return []
-        topic_files = sorted(os.listdir(topic_folder)[-num_retrieve:])
-        out = []
-        for file in topic_files:
-            file_path = os.path.join(topic_folder, file)
-            with open(file_path, encoding="utf-8") as f:
-                out.append(json.load(f))
-        return out
+        with os.scandir(topic_folder) as entries:
+            topic_files = [
+                entry.name for entry in entries
+                if not entry.name.endswith(".tmp")
+            ]
+        topic_files = sorted(topic_files[-num_retrieve:])
+        return [os.path.join(topic_folder, f) for f in topic_files]
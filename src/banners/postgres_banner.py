@@ -1,21 +1,30 @@
 """Implementation of Postgres Banner."""
 
-import copy
-import json
 import os
-import select
+## Aliased so sqlalchemy's select below does not shadow the module
+import select as stdlib_select
 import threading
 from typing import Callable, Optional
 
 from psycopg2 import sql
-from sqlalchemy import URL, create_engine, text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, Session
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import (DDL, URL, Index, bindparam, create_engine,
+                        delete, insert, select, text)
+from sqlalchemy import event as sqla_event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import (DeclarativeBase, Mapped,
+                            mapped_column, sessionmaker)
 
 
+from . import _json
 from .base_banner import BaseBanner
 
 class PostgresBanner(BaseBanner):
     """Banner implementation that uses an PostgresSQL table"""
+
+    ## NOTIFY payloads are capped at 8000 bytes; leave headroom
+    MAX_NOTIFY_PAYLOAD = 7500
+
     def __init__(self, **kwargs):
         """Initializer for PostgresBanner.
 
@@ -23,16 +32,43 @@ class PostgresBanner(BaseBanner):
         ----------
         **table_name: str (default=sql_banner)
             The folder path to look for banner events
+        **engine: Engine (optional)
+            An existing SQL Alchemy engine to share instead of
+            constructing a new one
         """
         super().__init__(**kwargs)
         self.table_name = kwargs.get("table_name", "sql_banner")
-        self._engine = None
+        self._engine = kwargs.get("engine")
+        ## Shared engines stay alive after this banner; only dispose
+        ## engines this instance constructed
+        self._owns_engine = self._engine is None
+        self._listen_conn = None
+        ## Rendered NOTIFY statements, keyed by topic
+        self._notify_queries = {}
+        ## Events fetched by id, cached since rows never change once
+        ## written; repeat notifications skip the SELECT entirely
+        self._event_cache = {}
+        ## Per-topic row counts so retire can skip COUNT round-trips
+        self._row_counts = {}
+        self._count_lock = threading.Lock()
         self._exit_event = threading.Event()
         self._exit_event.set()
         self._thread = None
-        self._create_engine(**kwargs)
+        if self._engine is None:
+            self._create_engine(**kwargs)
+        ## expire_on_commit=False keeps committed rows readable without
+        ## a refresh round-trip
+        self._session_factory = sessionmaker(
+            bind=self._engine,
+            expire_on_commit=False,
+        )
 
         self.banner_event = self._create_table(self.table_name)
+        self._build_hot_statements()
+        ## Retention runs server-side in an AFTER INSERT trigger;
+        ## skip the DDL when the installed limit already matches
+        self._trigger_keep_limit = None
+        self._sync_retention_trigger()
 
     def __del__(self):
         """Destructor that kills DB connection."""
@@ -41,7 +77,10 @@ class PostgresBanner(BaseBanner):
             self._exit_event.set()
         if self._thread is not None:
             self._thread.join()
-        if self._engine:
+        if self._listen_conn is not None:
+            self._listen_conn.close()
+            self._listen_conn = None
+        if self._engine and self._owns_engine:
             self._engine.dispose()
 
     def _create_engine(self, **kwargs):
@@ -72,11 +111,12 @@ class PostgresBanner(BaseBanner):
                 host=kwargs["host"],
                 database=kwargs["database"],
                 port=kwargs.get("port", 5432)
-            ))
+            ), **self._pool_settings())
             return
         if "SQL_CONNECTION_STRING" in os.environ:
             self._engine = create_engine(
-                os.environ["SQL_CONNECTION_STRING"]
+                os.environ["SQL_CONNECTION_STRING"],
+                **self._pool_settings(),
             )
             return
         raise ValueError((
@@ -85,6 +125,26 @@ class PostgresBanner(BaseBanner):
             "or env variable SQL_CONNECTION_STRING."
         ))
 
+    @staticmethod
+    def _pool_settings():
+        """Engine settings shared by both engine constructors.
+
+        Covers connection pooling plus the JSON codec for the JSONB
+        body column, which defaults to the slower stdlib module.
+
+        Returns
+        ----------
+        A dict of create_engine keyword arguments.
+        """
+        return {
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "json_serializer": _json.dumps,
+            "json_deserializer": _json.loads,
+        }
+
     def _create_table(self, table_name):
         """Create SQL Alchemy ORM tables and objects.
 
@@ -105,15 +165,232 @@ class PostgresBanner(BaseBanner):
         class BannerEvent(Base):
             """SQL Alchemy model."""
             __tablename__ = table_name
+            ## recall_events/retire and the retention trigger filter on
+            ## topic and order by timestamp, so index the pair to avoid
+            ## full-table scans; btree backward scans serve the DESC
+            ## ORDER BY without a separate descending index.
+            ## The GIN index supports server-side body containment
+            ## filters (@>).
+            __table_args__ = (
+                Index(f"ix_{table_name}_topic_timestamp",
+                      "topic", "timestamp"),
+                Index(f"ix_{table_name}_body_gin", "body",
+                      postgresql_using="gin"),
+            )
 
             id: Mapped[int] = mapped_column(primary_key=True)
             topic: Mapped[str]
             timestamp: Mapped[str]
-            body: Mapped[Optional[str]]
+            body: Mapped[Optional[dict]] = mapped_column(JSONB)
 
         Base.metadata.create_all(self._engine)
+        ## The retention trigger's function is not owned by the table;
+        ## drop it alongside so a table drop leaves nothing orphaned
+        func = self._quote_identifier(f"banners_retire_{table_name}")
+        sqla_event.listen(
+            BannerEvent.__table__, "after_drop",
+            DDL(f"DROP FUNCTION IF EXISTS {func}()")
+        )
         return BannerEvent
 
+    def _quote_identifier(self, name: str) -> str:
+        """Quote an identifier for interpolation into raw DDL.
+
+        Parameters
+        ----------
+        name: str
+            Identifier to quote.
+
+        Returns
+        -------
+        The identifier, quoted if the dialect requires it
+        """
+        return self._engine.dialect.identifier_preparer.quote(name)
+
+    def _build_hot_statements(self):
+        """Build the hot query statements once with bind parameters.
+
+        The per-call values are supplied at execute time, so repeated
+        calls skip Python-side expression construction and always hit
+        SQLAlchemy's compiled-statement cache.
+        """
+        event = self.banner_event
+        self._insert_stmt = insert(event).returning(
+            event.id, sort_by_parameter_order=True)
+        self._select_event_stmt = select(
+            event.topic, event.timestamp, event.body) \
+            .where(event.id == bindparam("event_id"))
+
+        newest = select(event.topic, event.timestamp, event.body) \
+            .where(event.topic == bindparam("topic")) \
+            .order_by(event.timestamp.desc()) \
+            .limit(bindparam("num_retrieve")) \
+            .subquery()
+        self._recall_stmt = select(newest) \
+            .order_by(newest.c.timestamp) \
+            .execution_options(yield_per=100)
+
+        keep_ids = select(event.id) \
+            .where(event.topic == bindparam("topic")) \
+            .order_by(event.timestamp.desc()) \
+            .limit(bindparam("num_keep"))
+        self._retire_stmt = delete(event) \
+            .where(event.topic == bindparam("topic")) \
+            .where(event.id.not_in(keep_ids)) \
+            .execution_options(synchronize_session=False)
+
+    def _install_retention_trigger(self):
+        """Install the AFTER INSERT trigger that enforces retention.
+
+        The trigger deletes everything but the newest
+        max_events_in_topic rows of the inserted topic inside the
+        insert transaction, so publishing pays no extra round-trips
+        for cleanup. A negative limit disables the trigger, matching
+        retire's no-delete convention.
+        """
+        ## Quote the interpolated identifiers; table names that need
+        ## quoting would otherwise break or inject through the DDL
+        table = self._quote_identifier(self.table_name)
+        func = self._quote_identifier(
+            f"banners_retire_{self.table_name}"
+        )
+        num_keep = int(self.max_events_in_topic)
+        with self._engine.begin() as con:
+            con.execute(text(
+                f"DROP TRIGGER IF EXISTS {func} ON {table};"
+            ))
+            if num_keep < 0:
+                con.execute(text(
+                    f"DROP FUNCTION IF EXISTS {func}();"
+                ))
+            else:
+                con.execute(text(f"""
+                    CREATE OR REPLACE FUNCTION {func}()
+                    RETURNS trigger AS $$
+                    BEGIN
+                        DELETE FROM {table}
+                        WHERE topic = NEW.topic
+                        AND id NOT IN (
+                            SELECT id FROM {table}
+                            WHERE topic = NEW.topic
+                            ORDER BY timestamp DESC
+                            LIMIT {num_keep}
+                        );
+                        RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                """))
+                con.execute(text(f"""
+                    CREATE TRIGGER {func}
+                    AFTER INSERT ON {table}
+                    FOR EACH ROW EXECUTE FUNCTION {func}();
+                """))
+                ## Record the limit on the function so other banners
+                ## on this table can see what is installed
+                con.execute(text(
+                    f"COMMENT ON FUNCTION {func}() IS '{num_keep}'"
+                ))
+        self._trigger_keep_limit = num_keep
+
+    def _installed_trigger_limit(self):
+        """Read the keep limit recorded on the installed trigger.
+
+        Returns
+        -------
+        The limit from the trigger function's comment, or None when
+        the function does not exist or carries no readable limit
+        """
+        with self._engine.connect() as con:
+            comment = con.execute(
+                text("SELECT obj_description(oid, 'pg_proc') "
+                     "FROM pg_proc WHERE proname = :name"),
+                {"name": f"banners_retire_{self.table_name}"},
+            ).scalar()
+        try:
+            return int(comment)
+        except (TypeError, ValueError):
+            return None
+
+    def _sync_retention_trigger(self) -> bool:
+        """Install the retention trigger if the limit is not in place.
+
+        Checks the limit recorded in the catalog first, so a banner
+        whose limit another instance already installed skips the DDL
+        and its ACCESS EXCLUSIVE table lock.
+
+        Returns
+        -------
+        True when the trigger DDL was actually run
+        """
+        installed = self._installed_trigger_limit()
+        if installed is not None and installed == int(self.max_events_in_topic):
+            self._trigger_keep_limit = installed
+            return False
+        self._install_retention_trigger()
+        return True
+
+    def _maybe_retire(self, topic: str) -> None:
+        """Retention is enforced by the insert trigger, not per wave.
+
+        If max_events_in_topic changed since the trigger was installed,
+        reinstall it and run one catch-up retire so the new limit takes
+        effect immediately. All banners sharing a table must agree on
+        max_events_in_topic; publishers with differing limits would
+        each reinstall the trigger with their own value.
+
+        Parameters
+        ----------
+        topic: str
+            Topic that was just published to.
+        """
+        if self.max_events_in_topic != self._trigger_keep_limit:
+            if self._sync_retention_trigger():
+                self.retire(topic)
+
+    def _get_listen_connection(self):
+        """Return the dedicated notification connection, creating it lazily.
+
+        LISTEN registrations are per-connection, so all LISTEN/UNLISTEN
+        commands and the watcher share this single autocommit connection
+        for the lifetime of the banner.
+
+        Returns
+        ----------
+        The pooled connection used for notifications.
+        """
+        if self._listen_conn is None:
+            self._listen_conn = self._engine.raw_connection()
+            self._listen_conn.connection.set_isolation_level(
+                ISOLATION_LEVEL_AUTOCOMMIT
+            )
+        return self._listen_conn
+
+    def _notify_query(self, topic, con):
+        """Return the cached NOTIFY statement for a topic.
+
+        The channel identifier is quoted with psycopg2's sql.Identifier
+        so arbitrary topic names cannot inject SQL, and the rendered
+        statement is cached so each topic is composed and quoted once
+        instead of on every wave.
+
+        Parameters
+        ----------
+        topic: str
+            Topic whose NOTIFY statement is needed.
+        con: Connection
+            SQL Alchemy connection used to render the statement.
+
+        Returns
+        ----------
+        A bindable TextClause with a :payload parameter.
+        """
+        if topic not in self._notify_queries:
+            self._notify_queries[topic] = text(sql.SQL(
+                "NOTIFY {}, :payload;").format(
+                sql.Identifier(topic)
+            ).as_string(con.connection.cursor()))
+        return self._notify_queries[topic]
+
     def _get_event_by_id(self, event_id: int):
         """Query an event by id.
 
@@ -124,24 +401,30 @@ class PostgresBanner(BaseBanner):
 
         Returns
         ----------
-        The SQL Alchemy ORM object of the saved event.
+        A dictionary of the saved event.
         """
-        with self._engine.connect() as connection:
-            with Session(bind=connection) as session:
-                res = session.query(self.banner_event) \
-                             .where(self.banner_event.id == event_id)
-                if res.count() == 0:
-                    raise ValueError(f"Event ID {event_id} not found")
-                out = self._convert_sql_object_to_dict(res[0])
-        return  out
+        if event_id in self._event_cache:
+            return self._event_cache[event_id]
+        with self._session_factory() as session:
+            row = session.execute(
+                self._select_event_stmt,
+                {"event_id": event_id},
+            ).first()
+        if row is None:
+            raise ValueError(f"Event ID {event_id} not found")
+        event = self._convert_sql_object_to_dict(row)
+        if len(self._event_cache) >= 1024: # Bound the cache
+            self._event_cache.clear()
+        self._event_cache[event_id] = event
+        return event
 
     def _convert_sql_object_to_dict(self, obj):
-        """Convert SQLAlchemy ORM object to dictionary.
+        """Convert a result row to an event dictionary.
 
         Parameters
         ----------
-        obj: BannerEvent
-            ORM Object to convert.
+        obj: Row
+            Row with topic/timestamp/body attributes to convert.
 
         Returns
         ----------
@@ -150,7 +433,7 @@ class PostgresBanner(BaseBanner):
         return  {
                 'topic': obj.topic,
                 'banner_timestamp': obj.timestamp,
-                **json.loads(obj.body)
+                **(obj.body or {})
         }
 
     def _add_event_to_table(self, body):
@@ -165,47 +448,78 @@ class PostgresBanner(BaseBanner):
         ----------
         The id of the saved event.
         """
-        ## Add to sql table
-        timestamp = body.pop("banner_timestamp")
-        topic = body.pop("topic")
-        with self._engine.connect() as connection:
-            with Session(bind=connection) as session:
-                event = self.banner_event(
-                    topic=topic,
-                    timestamp=timestamp,
-                    body=json.dumps(body)
-                )
-                session.add(event)
-                session.commit()
-                event_id = event.id
+        return self._add_events_to_table([body])[0]
 
-        return event_id
+    def _add_events_to_table(self, bodies):
+        """Add a batch of events to the SQL table in one commit.
 
-    def wave(self, topic: str, body: dict = None) -> None:
-        """Create a new event in a given topic.
+        The input dictionaries are not mutated, so callers do not need
+        defensive copies.
 
         Parameters
         ----------
-        topic: str
-            Topic under which to publish the new event.
-        body: dict
-            Information to publish to the topic.
+        bodies: list
+            Event dictionaries to save, in publish order.
+
+        Returns
+        ----------
+        The ids of the saved events, in publish order.
         """
-        body = self._validate_body(body, topic)
+        rows = []
+        for body in bodies:
+            rows.append({
+                "topic": body["topic"],
+                "timestamp": body["banner_timestamp"],
+                "body": {
+                    k: v for k, v in body.items()
+                    if k not in ("topic", "banner_timestamp")
+                }
+            })
+        with self._session_factory() as session:
+            ## INSERT ... RETURNING id fuses the insert and the id
+            ## fetch into one statement with no ORM flush cycle
+            event_ids = list(session.execute(
+                self._insert_stmt, rows).scalars())
+            session.commit()
+
+        with self._count_lock:
+            for row in rows:
+                if row["topic"] in self._row_counts:
+                    self._row_counts[row["topic"]] += 1
+
+        return event_ids
+
+    def _wave_batch(self, events: list) -> None:
+        """Commit a batch of events in one transaction.
+
+        All inserts share one commit, then one NOTIFY is issued per
+        event on a single connection.
 
-        event_id = self._add_event_to_table(copy.deepcopy(body))
+        Parameters
+        ----------
+        events: list
+            (topic, body) pairs to write, in publish order.
+        """
+        topics = [topic for topic, _ in events]
+        event_ids = self._add_events_to_table([body for _, body in events])
 
         with self._engine.connect() as con:
-            query = text(sql.SQL(
-                "NOTIFY {}, :event_id;").format(
-                sql.Identifier(topic)
-            ).as_string(con.connection.cursor()))
-            con.execute(
-                query
-                .bindparams(event_id=str(event_id)),
-            )
+            for (topic, body), event_id in zip(events, event_ids):
+                ## Pack the event into the payload so watchers skip the
+                ## SELECT-by-id round-trip; oversized bodies fall back
+                ## to an id-only payload
+                payload = _json.dumps({"id": event_id, "body": body})
+                ## The 8000-byte NOTIFY limit is in bytes, not chars
+                if len(payload.encode("utf-8")) > self.MAX_NOTIFY_PAYLOAD:
+                    payload = _json.dumps({"id": event_id})
+                con.execute(
+                    self._notify_query(topic, con)
+                    .bindparams(payload=payload),
+                )
             con.commit()
-        self.retire(topic)
+
+        for topic in topics:
+            self._maybe_retire(topic)
 
     def watch(self, topic: str,
               callback: Callable[dict, None],
@@ -227,6 +541,12 @@ class PostgresBanner(BaseBanner):
             raise ValueError(f"Topic: {topic} already being watched")
         self.watched_topics[topic] = callback
 
+        conn = self._get_listen_connection()
+        with conn.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("LISTEN {};").format(sql.Identifier(topic))
+            )
+
         if self._exit_event.is_set():
             self._exit_event.clear()
             self._thread = threading.Thread(
@@ -236,20 +556,10 @@ class PostgresBanner(BaseBanner):
             )
             self._thread.start()
 
-        with self._engine.connect() as con:
-            query = text(sql.SQL(
-                "LISTEN {};").format(
-                sql.Identifier(topic)
-            ).as_string(con.connection.cursor()))
-            con.execute(
-                query
-            )
-            con.commit()
-
     def _watch_thread(self, topic: str,
               callback: Callable[dict, None],
               start_time: str="") -> None:
-        """Look for events by ls'ing the topic directory
+        """Wait for NOTIFY messages on the dedicated LISTEN connection.
 
         Parameters
         ----------
@@ -260,18 +570,25 @@ class PostgresBanner(BaseBanner):
         start_time: str (default="")
             Timestamp to ignore previous events
         """
+        conn = self._get_listen_connection().connection
         while not self._exit_event.is_set():
             empty = ([],[],[])
-            with self._engine.connect() as conn:
-                if not select.select(
-                    [conn.connection],[],[],self.watch_rate
-                ) == empty:
-                    conn.connection.poll()
-                    while conn.connection.notifies:
-                        notify = conn.connection.notifies.pop(0)
-                        if notify.channel in self.watched_topics:
-                            callback = self.watched_topics[notify.channel]
-                            callback(self._get_event_by_id(notify.payload))
+            if stdlib_select.select([conn],[],[],self.watch_rate) == empty:
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                if notify.channel not in self.watched_topics:
+                    continue
+                callback = self.watched_topics[notify.channel]
+                payload = _json.loads(notify.payload)
+                if isinstance(payload, dict) and "body" in payload:
+                    callback(payload["body"])
+                else:
+                    ## Id-only payload, fetch the event body
+                    event_id = payload["id"] \
+                        if isinstance(payload, dict) else payload
+                    callback(self._get_event_by_id(event_id))
 
     def ignore(self, topic: str):
         """Unsubscribe from a topic.
@@ -284,12 +601,11 @@ class PostgresBanner(BaseBanner):
         if topic not in self.watched_topics:
             return
         self.watched_topics.pop(topic)
-        with self._engine.connect() as con:
-            con.execute(
-                text(sql.SQL("UNLISTEN {};").format(sql.Identifier(topic)
-                ).as_string(con.connection.cursor()))
+        conn = self._get_listen_connection()
+        with conn.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("UNLISTEN {};").format(sql.Identifier(topic))
             )
-            con.commit()
         if not self.watched_topics: # If no more watched topics, kill thread
             self._exit_event.set()
 
@@ -308,20 +624,28 @@ class PostgresBanner(BaseBanner):
         if num_keep < 0:
             return
 
-        with self._engine.connect() as connection:
-            with Session(bind=connection) as session:
-                total_rows = session.query(self.banner_event).count()
+        with self._count_lock:
+            cached_count = self._row_counts.get(topic)
+        if cached_count is not None and cached_count <= num_keep:
+            return
 
-                if num_keep >= total_rows:
-                    return
+        with self._session_factory() as session:
+            ## Keep the newest num_keep events, delete the rest in
+            ## one statement instead of a per-row ORM loop
+            result = session.execute(
+                self._retire_stmt,
+                {"topic": topic, "num_keep": num_keep},
+            )
+            session.commit()
 
-                res = session.query(self.banner_event) \
-                       .where(self.banner_event.topic == topic) \
-                       .order_by(self.banner_event.timestamp) \
-                       .limit(total_rows-num_keep)[:]
-                for obj in res:
-                    session.delete(obj)
-                session.commit()
+        ## At most num_keep rows remain after the delete; a cold cache
+        ## seeds at that upper bound rather than paying a COUNT
+        if cached_count is None:
+            remaining = num_keep
+        else:
+            remaining = cached_count - max(result.rowcount, 0)
+        with self._count_lock:
+            self._row_counts[topic] = remaining
 
     def recall_events(self, topic: str, num_retrieve: int=None):
         """Get the most recent N events in the topic.
@@ -336,16 +660,32 @@ class PostgresBanner(BaseBanner):
         -------
         A list of events
         """
+        return list(self.recall_events_iter(topic, num_retrieve))
+
+    def recall_events_iter(self, topic: str, num_retrieve: int=None):
+        """Yield the most recent N events in the topic, one at a time.
+
+        Streaming variant of recall_events; rows are fetched from the
+        server in chunks instead of materializing the full result.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to recall events.
+        num_retrieve: int (default=None)
+            Number of events to retrieve. None yields max_events_in_topic
+        Returns
+        -------
+        A generator of events
+        """
         num_retrieve = self._verify_recall_num_retrieve(num_retrieve)
 
-        with self._engine.connect() as connection:
-            with Session(bind=connection) as session:
-                results = session.query(self.banner_event) \
-                       .where(self.banner_event.topic == topic) \
-                       .order_by(self.banner_event.timestamp.desc()) \
-                       .limit(num_retrieve)[::-1]
-
-        return [
-            self._convert_sql_object_to_dict(res)
-            for res in results
-        ]
+        with self._session_factory() as session:
+            ## Newest N rows, streamed back in chronological order.
+            ## Selecting columns skips ORM object construction per row.
+            results = session.execute(
+                self._recall_stmt,
+                {"topic": topic, "num_retrieve": num_retrieve},
+            )
+            for res in results:
+                yield self._convert_sql_object_to_dict(res)
@@ -1,12 +1,12 @@
 """Implementation of S3 Banner."""
 
-import json
 import os
 from pathlib import Path
 from typing import Callable
 
 import s3fs
 
+from . import _json
 from .base_banner import BaseBanner
 
 ## Ignoring duplicate code because this is inherently similar to LocalBanner
@@ -36,33 +36,44 @@ class S3Banner(BaseBanner):
         if not self.s3.exists(self.root_path):
             self.s3.mkdir(self.root_path, create_parents=True)
 
-    def wave(self, topic: str, body: dict = None) -> None:
-        """Create a new event in a given topic.
+        ## Topic prefixes already confirmed to exist, so publishing
+        ## only pays the exists HEAD request once per topic
+        self._known_prefixes = set()
+
+    def _wave_batch(self, events: list) -> None:
+        """Write a batch of events to their topic folders.
+
+        The objects are uploaded with one batched pipe call, so the PUT
+        requests run concurrently instead of one round-trip per event.
 
         Parameters
         ----------
-        topic: str
-            Topic under which to publish the new event.
-        body: dict
-            Information to publish to the topic.
+        events: list
+            (topic, body) pairs to write, in publish order.
         """
-        body = self._validate_body(body, topic)
-
-        topic_path = Path(self.root_path)  / topic
-        if not self.s3.exists(topic_path):
-            self.s3.mkdir(topic_path)
-        file_name = self._generate_timestamp_string()
-        file_path = topic_path / (file_name + ".json")
-        with self.s3.open(file_path, "wt") as f:
-            json.dump(body, f)
-
-        self.retire(topic)
+        payloads = {}
+        for topic, body in events:
+            topic_path = Path(self.root_path)  / topic
+            if str(topic_path) not in self._known_prefixes:
+                if not self.s3.exists(topic_path):
+                    self.s3.mkdir(topic_path)
+                self._known_prefixes.add(str(topic_path))
+            file_name = self._generate_timestamp_string()
+            file_path = topic_path / (file_name + ".json")
+            payloads[str(file_path)] = _json.dumps_bytes(body)
+        self.s3.pipe(payloads)
+
+        for topic, _ in events:
+            self._maybe_retire(topic)
 
     def _watch_thread(self, topic: str,
               callback: Callable[dict, None],
               start_time: str="") -> None:
         """Look for events by ls'ing the topic directory
 
+        New events are fetched in one batched cat call, so the GET
+        requests run concurrently instead of one round-trip per file.
+
         Parameters
         ----------
         topic: str
@@ -80,16 +91,20 @@ class S3Banner(BaseBanner):
             exit_event.wait(self.watch_rate)
             if not self.s3.exists(topic_folder):
                 continue
-            topic_files = sorted(self.s3.ls(topic_folder))
-            for file in topic_files:
-                # Ignore old files
-                if Path(file).stem <= start_time:
-                    continue
+            ## S3 lists keys lexically and the timestamp file names
+            ## sort chronologically, so no extra sorting is needed
+            topic_files = self.s3.ls(topic_folder)
+            # Ignore old files
+            new_files = [
+                f for f in topic_files if Path(f).stem > start_time
+            ]
+            if not new_files:
+                continue
+            blobs = self.s3.cat(new_files)
+            for file in new_files:
                 start_time = Path(file).stem # Update start time
-
                 # Load json into callback
-                with self.s3.open(file) as f:
-                    callback(json.load(f))
+                callback(_json.loads(blobs[file]))
 
     def retire(self, topic: str, num_keep: int=None) -> None:
         """Delete old events in a given topic.
@@ -108,7 +123,7 @@ class S3Banner(BaseBanner):
         topic_folder = "/".join([self.root_path, topic])
         if not self.s3.exists(topic_folder):
             return
-        topic_files = sorted(self.s3.ls(topic_folder))
+        topic_files = self.s3.ls(topic_folder)
         files_to_delete = topic_files[:-num_keep or None]
         if len(files_to_delete) > 0:
             self.s3.rm(files_to_delete)
@@ -131,9 +146,35 @@ class S3Banner(BaseBanner):
         topic_folder = "/".join([self.root_path, topic])
         if not self.s3.exists(topic_folder):
             return []
-        topic_files = sorted(self.s3.ls(topic_folder)[-num_retrieve:])
-        out = []
+        topic_files = self.s3.ls(topic_folder)[-num_retrieve:]
+        if not topic_files:
+            return []
+        ## Fetch the objects concurrently in one batched cat call
+        blobs = self.s3.cat(topic_files)
+        return [_json.loads(blobs[f]) for f in topic_files]
+
+    def recall_events_iter(self, topic: str, num_retrieve: int=None):
+        """Yield the most recent N events in the topic, one at a time.
+
+        Streaming variant of recall_events; only one event is held in
+        memory at a time.
+
+        Parameters
+        ----------
+        topic: str
+            Topic to recall events.
+        num_retrieve: int (default=None)
+            Number of events to retrieve. None yields max_events_in_topic
+        Returns
+        -------
+        A generator of events
+        """
+        num_retrieve = self._verify_recall_num_retrieve(num_retrieve)
+
+        topic_folder = "/".join([self.root_path, topic])
+        if not self.s3.exists(topic_folder):
+            return
+        topic_files = self.s3.ls(topic_folder)[-num_retrieve:]
         for file in topic_files:
             with self.s3.open(file) as f:
-                out.append(json.load(f))
-        return out
+                yield _json.loads(f.read())
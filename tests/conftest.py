@@ -1,9 +1,15 @@
 """Fixtures common for the BaseBanner validation"""
 
+import os
+import queue
 import random
+import shutil
+import threading
+import time
 
 import pytest
 import s3fs
+from sqlalchemy import create_engine
 
 from banners import LocalBanner, S3Banner, PostgresBanner
 
@@ -18,8 +24,43 @@ def fixture_local_banner(tmp_path):
     banner.__del__()
 
 
+@pytest.fixture(name="validator_banner", scope="module")
+def fixture_validator_banner(tmp_path_factory):
+    """Single shared LocalBanner for tests that never mutate topics"""
+    banner = LocalBanner(root_path=tmp_path_factory.mktemp("validator"))
+    yield banner
+    ## This forces thread deletion.
+    # pylint: disable-next=unnecessary-dunder-call
+    banner.__del__()
+
+
+@pytest.fixture(name="s3_bucket_cleanup", scope="session")
+def fixture_s3_bucket_cleanup():
+    """Delete S3 buckets in the background, off the teardown path"""
+    cleanup_queue = queue.Queue()
+    def drain():
+        while True:
+            bucket_name = cleanup_queue.get()
+            try:
+                s3fs.S3FileSystem().rm(bucket_name, recursive=True)
+            ## A failed delete (transient error, bucket never created)
+            ## must not kill the worker and wedge later deletions
+            # pylint: disable-next=broad-exception-caught
+            except Exception:
+                pass
+            finally:
+                cleanup_queue.task_done()
+    threading.Thread(target=drain, daemon=True).start()
+    yield cleanup_queue.put
+    ## Bounded wait for queued deletions so a stuck delete cannot
+    ## hang the session exit; the worker is a daemon thread
+    deadline = time.monotonic() + 30
+    while cleanup_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
 @pytest.fixture(name="s3_bucket")
-def fixture_s3_bucket():
+def fixture_s3_bucket(s3_bucket_cleanup):
     """Generate and cleanup a default bucket for S3 testing"""
     s3 = s3fs.S3FileSystem(
         # client_kwargs={"endpoint_url": os.environ["S3_ENDPOINT"]}
@@ -27,7 +68,7 @@ def fixture_s3_bucket():
     bucket_name = f"banners-test-bucket-{random.randint(0,100000)}"
     s3.mkdir(bucket_name)
     yield bucket_name
-    s3.rm(bucket_name, recursive=True)
+    s3_bucket_cleanup(bucket_name)
 
 
 @pytest.fixture(name="s3_banner")
@@ -40,21 +81,34 @@ def fixture_s3_banner(s3_bucket):
     banner.__del__()
 
 
+@pytest.fixture(name="sql_engine", scope="module")
+def fixture_sql_engine():
+    """Single shared engine for the PostgresBanner fixtures"""
+    ## Disabling so the shared engine matches the library's settings
+    # pylint: disable-next=protected-access
+    engine = create_engine(
+        os.environ["SQL_CONNECTION_STRING"],
+        **PostgresBanner._pool_settings(),
+    )
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture(name="sql_table")
-def fixture_sql_table():
+def fixture_sql_table(sql_engine):
     """Generate and cleanup a default bucket for S3 testing"""
     table_name = f"sql_banner_test_{random.randint(0,100000)}"
     yield table_name
-    banner = PostgresBanner(table_name=table_name)
+    banner = PostgresBanner(table_name=table_name, engine=sql_engine)
     ## Disabling so we can cleanup
     # pylint: disable-next=protected-access
     banner.banner_event.__table__.drop(banner._engine)
 
 
 @pytest.fixture(name="sql_banner")
-def fixture_sql_banner(sql_table):
+def fixture_sql_banner(sql_table, sql_engine):
     """Generate and cleanup a default banner using PostgresBanner"""
-    banner = PostgresBanner(table_name=sql_table)
+    banner = PostgresBanner(table_name=sql_table, engine=sql_engine)
     yield banner
     # This forces thread deletion.
     # pylint: disable-next=unnecessary-dunder-call
@@ -67,10 +121,31 @@ def fixture_banner(request):
     return request.getfixturevalue(request.param)
 
 
+@pytest.fixture(name="local_topic_template", scope="module")
+def fixture_local_topic_template(tmp_path_factory):
+    """Build the 10-event topic once and reuse it as a file template"""
+    banner = LocalBanner(root_path=tmp_path_factory.mktemp("template"))
+    banner.wave_many("test", [{"event": i} for i in range(10)])
+    topic_path = os.path.join(banner.root_path, "test")
+    ## This forces thread deletion.
+    # pylint: disable-next=unnecessary-dunder-call
+    banner.__del__()
+    return topic_path
+
+
 @pytest.fixture(name="loaded_banner")
-def fixture_loaded_banner(banner):
+def fixture_loaded_banner(request, banner):
     """Load the default banner with 10 events"""
     banner.max_events_in_topic = 10
-    for i in range(banner.max_events_in_topic):
-        banner.wave("test", {"event": i})
+    if isinstance(banner, LocalBanner):
+        ## Restore the pre-built topic snapshot with one tree copy
+        ## instead of re-publishing the events
+        template = request.getfixturevalue("local_topic_template")
+        shutil.copytree(template, os.path.join(banner.root_path, "test"),
+                        dirs_exist_ok=True)
+    else:
+        ## One batched write instead of ten round-trips
+        banner.wave_many("test", [
+            {"event": i} for i in range(banner.max_events_in_topic)
+        ])
     yield banner
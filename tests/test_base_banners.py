@@ -1,6 +1,6 @@
 """Tests for the base Banners functionality"""
 
-import copy
+import concurrent.futures
 import threading
 import time
 
@@ -8,64 +8,79 @@ import pytest
 
 from banners import LocalBanner, PostgresBanner
 
-def test_validate_body_existing_fields(local_banner):
+def test_validate_body_existing_fields(validator_banner):
     """Verify validate body"""
     good_body = {"random": 4, "topic": "test", "banner_timestamp": "test"}
     # Disabling pylint to test the given function
     # pylint: disable-next=protected-access
-    good_body = local_banner._validate_body(good_body, "test")
+    good_body = validator_banner._validate_body(good_body, "test")
 
     assert good_body["random"] == 4
 
 @pytest.mark.parametrize("body", [(None), ({}),])
-def test_validate_body_missing_fields(local_banner, body):
+def test_validate_body_missing_fields(validator_banner, body):
     """Verify fail cases for validate body"""
     # pylint: disable-next=protected-access
-    body = local_banner._validate_body(body, "test")
+    body = validator_banner._validate_body(body, "test")
     assert "topic" in body
     assert body["topic"] == "test"
     assert "banner_timestamp" in body
 
-def test_validate_body_timestamp(local_banner):
+def test_validate_body_timestamp(validator_banner):
     """Verify fail cases for validate body"""
     ## Disabling these because we're testing the functions
     # pylint: disable-next=protected-access
-    pre_stamp = local_banner._generate_timestamp_string()
+    pre_stamp = validator_banner._generate_timestamp_string()
     # pylint: disable-next=protected-access
-    body = local_banner._validate_body({}, "test")
+    body = validator_banner._validate_body({}, "test")
     # pylint: disable-next=protected-access
-    post_stamp = local_banner._generate_timestamp_string()
+    post_stamp = validator_banner._generate_timestamp_string()
 
     assert "banner_timestamp" in body
     assert body["banner_timestamp"] < post_stamp
     assert body["banner_timestamp"] > pre_stamp
 
 
+@pytest.mark.xdist_group("thread_enum")
 def test_del_removes_threads():
-    """Verify __del__ removes all watch threads"""
+    """Verify __del__ stops all watch tasks"""
     banner = LocalBanner()
     banner.watch_rate = 0.05
-    test_threads = ["test1", "test2", "test3"]
-    for test_thread in test_threads:
-        banner.watch(test_thread, lambda a: None)
-    time.sleep(0.05)
+    test_topics = ["test1", "test2", "test3"]
+    for test_topic in test_topics:
+        banner.watch(test_topic, lambda a: None)
+    futures = [banner.watched_topics[t]['future'] for t in test_topics]
 
     ## This forces thread deletion.
     # pylint: disable-next=unnecessary-dunder-call
     banner.__del__()
-    time.sleep(0.05)
-    threads = [t.name for t in threading.enumerate()]
-    for test_thread in test_threads:
-        assert f"banners_watch_{test_thread}" not in threads
+    assert not banner.watched_topics
+    ## Wait directly on the watcher futures so the test proceeds at
+    ## task-exit speed instead of sleeping out fixed delays
+    _, not_done = concurrent.futures.wait(futures, timeout=1.0)
+    assert not not_done
+
+
+def test_watch_too_many_topics(tmp_path):
+    """Verify watch raises once the watcher pool is saturated"""
+    banner = LocalBanner(root_path=tmp_path, max_watchers=2)
+    banner.watch_rate = 0.05
+    banner.watch("test1", lambda a: None)
+    banner.watch("test2", lambda a: None)
+
+    error_msg = "Watcher pool is full"
+    with pytest.raises(ValueError, match=error_msg):
+        banner.watch("test3", lambda a: None)
+    ## This forces thread deletion.
+    # pylint: disable-next=unnecessary-dunder-call
+    banner.__del__()
 
 
 @pytest.mark.parametrize("body", [(None), ({"data": "value"})])
 def test_wave_inputs(banner, body):
     """Verify wave can be used with recall_events"""
-    if body is None:
-        comp_body = {}
-    else:
-        comp_body = copy.deepcopy(body)
+    ## A shallow copy is enough; only scalar values are compared
+    comp_body = dict(body) if body else {}
     banner.retire("test", 0)
     banner.wave("test", body)
     waved_banners = banner.recall_events("test", 100)
@@ -77,6 +92,22 @@ def test_wave_inputs(banner, body):
         assert waved_banners[0]['data'] == comp_body['data']
 
 
+def test_wave_keeps_caller_fields(banner):
+    """Verify wave does not strip fields from the caller's body"""
+    body = {"data": "value"}
+    banner.wave("test", body)
+    assert body["data"] == "value"
+
+
+def test_wave_many(banner):
+    """Verify wave_many commits a whole batch at once"""
+    banner.retire("test", 0)
+    banner.wave_many("test", [{"iter": i} for i in range(5)])
+    events = banner.recall_events("test", 10)
+    assert len(events) == 5
+    assert [e["iter"] for e in events] == list(range(5))
+
+
 def test_wave_auto_retires(banner):
     """Verify wave auto retires old events"""
     banner.max_events_in_topic = 2
@@ -87,6 +118,35 @@ def test_wave_auto_retires(banner):
     assert len(banner.recall_events("test", 10)) == banner.max_events_in_topic
 
 
+def test_wave_batched_buffers_until_flush(tmp_path):
+    """Verify batched waves are buffered, and flushed on demand"""
+    banner = LocalBanner(root_path=tmp_path, batch_size=3, flush_interval=60)
+    banner.wave("test", {"event": 0})
+    assert len(banner.recall_events("test", 10)) == 0
+
+    banner.flush()
+    assert len(banner.recall_events("test", 10)) == 1
+
+    banner.wave("test", {"event": 1})
+    banner.wave_sync("test", {"event": 2})
+    assert len(banner.recall_events("test", 10)) == 3
+    ## This forces thread deletion.
+    # pylint: disable-next=unnecessary-dunder-call
+    banner.__del__()
+
+
+def test_wave_batched_del_flushes(tmp_path):
+    """Verify buffered events are committed on deletion"""
+    banner = LocalBanner(root_path=tmp_path, batch_size=3, flush_interval=60)
+    banner.wave("test", {"event": 0})
+    ## This forces thread deletion.
+    # pylint: disable-next=unnecessary-dunder-call
+    banner.__del__()
+
+    check_banner = LocalBanner(root_path=tmp_path)
+    assert len(check_banner.recall_events("test", 10)) == 1
+
+
 def test_watch_existing_topic(banner):
     """Verify watch on watched topic throws error"""
     banner.watch("test", lambda a: None)
@@ -102,64 +162,56 @@ def test_watch_callback_called(banner):
     ## with how the fixtures copies the object
     if isinstance(banner, PostgresBanner):
         return
-    ## Only using this global to modify within the nested function.
-    # pylint: disable-next=global-variable-undefined
-    global TEST_CALLBACK_COUNTER
-    TEST_CALLBACK_COUNTER = 0
+    calls = []
+    called = threading.Event()
     def test_cb(data):
-        ## Only using this global to modify within the nested function.
-        # pylint: disable-next=global-variable-undefined
-        global TEST_CALLBACK_COUNTER
-        TEST_CALLBACK_COUNTER += 1
+        calls.append(data)
+        called.set()
     banner.watch_rate = 0.2
     banner.watch("test", test_cb)
-    time.sleep(0.1)
     banner.wave("test")
-    time.sleep(banner.watch_rate+0.1)
-    assert TEST_CALLBACK_COUNTER == 1
+    ## Wait on the event so the test returns as soon as the callback
+    ## fires instead of sleeping out a fixed worst case
+    assert called.wait(timeout=banner.watch_rate*3)
+    assert len(calls) == 1
 
 
+@pytest.mark.xdist_group("thread_enum")
 def test_watch_spawns_thread(banner):
-    """verify watch creates a watcher thread"""
-    existing_threads = [t.name for t in threading.enumerate()]
-    assert "banners_watch_test" not in existing_threads
-
+    """verify watch creates a watcher task"""
     banner.watch_rate = 0.05
     banner.watch("test", lambda a: None)
 
     if isinstance(banner, PostgresBanner):
-        thread_name = "banners_watch_sql"
+        ## Check the banner's own thread handle instead of scanning
+        ## process-wide thread state
+        # pylint: disable-next=protected-access
+        assert banner._thread.is_alive()
     else:
-        thread_name = "banners_watch_test"
+        ## Poll under a deadline rather than a fixed sleep; a done
+        ## future means the watcher crashed instead of running
+        future = banner.watched_topics["test"]["future"]
+        deadline = time.monotonic() + 1
+        while not future.running() and time.monotonic() < deadline:
+            assert not future.done()
+            time.sleep(0.005)
+        assert future.running()
 
-    new_threads = [t.name for t in threading.enumerate()]
-    assert thread_name in new_threads
 
-
-@pytest.mark.parametrize("watch_rate", [(0.1), (0.5)])
+@pytest.mark.parametrize("watch_rate", [(0.02), (0.1)])
 def test_watch_sleeps(banner, watch_rate):
     """Verify the watch_rate changes the cycle time"""
 
     # Skip if postgres banner because sleep doesn't apply
     if isinstance(banner, PostgresBanner):
         return
-    ## Only using this global to modify within the nested function.
-    # pylint: disable-next=global-variable-undefined
-    global end_time
-    end_time = None
-    def test_cb(data):
-        ## Only using this global to modify within the nested function.
-        # pylint: disable-next=global-variable-undefined
-        global end_time
-        end_time = time.time()
+    done = threading.Event()
     banner.watch_rate = watch_rate
-    banner.watch("test", test_cb)
+    banner.watch("test", lambda data: done.set())
     banner.wave("test")
-    start_time = time.time()
-    while end_time is None and time.time() - start_time < banner.watch_rate:
-        time.sleep(0.02)
-
-    assert end_time - start_time < banner.watch_rate + 0.01
+    ## The callback must land within one watch cycle; waiting on the
+    ## event returns the moment it fires instead of spin-sleeping
+    assert done.wait(timeout=banner.watch_rate + 0.01)
 
 
 def test_ignore_with_nonexistant_topic(banner):
@@ -167,32 +219,40 @@ def test_ignore_with_nonexistant_topic(banner):
     banner.ignore("BAD_TOPIC")
 
 
+@pytest.mark.xdist_group("thread_enum")
 def test_ignore_removes_topic(banner):
-    """Verify ignore deletes indicated thread"""
+    """Verify ignore stops the indicated watcher"""
     banner.watch_rate = 0.05
     banner.watch("test", lambda a: None)
-    banner.ignore("test")
-    time.sleep(0.05)
-    threads = [t.name for t in threading.enumerate()]
-    assert "banners_watch_test" not in threads
+    if isinstance(banner, PostgresBanner):
+        banner.ignore("test")
+    else:
+        future = banner.watched_topics["test"]["future"]
+        banner.ignore("test")
+        assert future.done()
+    assert "test" not in banner.watched_topics
 
 
 @pytest.mark.parametrize("arg_val, expected", [
-    (3, 3),
-    (0, 0),
-    (-1, 10),
-    (None, 5),
+    pytest.param(3, 3, id="keep-three"),
+    pytest.param(0, 0, id="keep-none"),
+    pytest.param(-1, 10, id="negative-keeps-all"),
 ])
 def test_retire_with_input(loaded_banner, arg_val, expected):
-    """Test the function defaults to max_events_in_topic"""
-    loaded = loaded_banner
-    if arg_val is None:
-        loaded.max_events_in_topic = expected
-    loaded.retire("test", arg_val)
-    after_recall = len(loaded.recall_events("test", 1000))
+    """Verify retire keeps the requested number of events"""
+    loaded_banner.retire("test", arg_val)
+    after_recall = len(loaded_banner.recall_events("test", 1000))
     assert after_recall == expected
 
 
+def test_retire_default_num_keep(banner):
+    """Verify retire defaults to max_events_in_topic"""
+    banner.max_events_in_topic = 5
+    banner.wave_many("test", [{"event": i} for i in range(6)])
+    banner.retire("test")
+    assert len(banner.recall_events("test", 1000)) == 5
+
+
 @pytest.mark.parametrize("arg_val, expected", [
     (3, 3),
     (None, 10),
@@ -204,6 +264,17 @@ def test_recall_events(loaded_banner, arg_val, expected):
     assert len(events) == expected
 
 
+@pytest.mark.parametrize("arg_val, expected", [
+    (3, 3),
+    (None, 10),
+])
+def test_recall_events_iter(loaded_banner, arg_val, expected):
+    """Verify the streaming variant yields the last N events"""
+    events = list(loaded_banner.recall_events_iter("test", arg_val))
+    assert len(events) == expected
+    assert events == loaded_banner.recall_events("test", arg_val)
+
+
 @pytest.mark.parametrize("arg_val", [(0), (-1)])
 def test_recall_events_errors(loaded_banner, arg_val):
     """Verify positive integers required"""
@@ -1,6 +1,7 @@
 """Tests for the PostgresBanners."""
 
 import os
+import threading
 import time
 
 import pytest
@@ -10,9 +11,9 @@ from banners import PostgresBanner
 
 
 @pytest.fixture(name="second_sql_banner")
-def fixture_second_sql_banner(sql_table):
+def fixture_second_sql_banner(sql_table, sql_engine):
     """Generate and cleanup a default banner using PostgresBanner"""
-    banner2 = PostgresBanner(table_name=sql_table)
+    banner2 = PostgresBanner(table_name=sql_table, engine=sql_engine)
     yield banner2
     # This forces thread deletion.
     # pylint: disable-next=unnecessary-dunder-call
@@ -79,20 +80,18 @@ def test_sql_get_event_bad_id(sql_banner):
 
 def test_sql_watch_callback_called(sql_banner, second_sql_banner):
     """Verify watch hits the supplied callback"""
-    ## Only using this global to modify within the nested function.
-    # pylint: disable-next=global-variable-undefined
-    global TEST_CALLBACK_COUNTER
-    TEST_CALLBACK_COUNTER = 0
+    calls = []
+    called = threading.Event()
     def test_cb(data):
-        ## Only using this global to modify within the nested function.
-        # pylint: disable-next=global-variable-undefined
-        global TEST_CALLBACK_COUNTER
-        TEST_CALLBACK_COUNTER += 1
+        calls.append(data)
+        called.set()
     second_sql_banner.watch_rate = 0.1
 
     second_sql_banner.watch("test", test_cb)
     time.sleep(0.1)
     sql_banner.wave("test")
-    time.sleep(second_sql_banner.watch_rate+0.1)
-    assert TEST_CALLBACK_COUNTER == 1
+    ## Wait on the event so the test returns as soon as the callback
+    ## fires instead of sleeping out a fixed worst case
+    assert called.wait(timeout=second_sql_banner.watch_rate*3)
+    assert len(calls) == 1
     second_sql_banner.ignore("test")